@@ -9,6 +9,10 @@ import json
 from pathlib import Path
 
 
+_GH_RELEASE = "https://github.com/"
+_JSDELIVR = "https://cdn.jsdelivr.net/gh/"
+
+
 def create_manifest(plugin_dir, version="1.0.0"):
     """Create plugin store manifest file."""
     plugin_json_path = Path(plugin_dir) / "plugin.json"
@@ -18,8 +22,8 @@ def create_manifest(plugin_dir, version="1.0.0"):
         return
     
     # Load plugin.json
-    with open(plugin_json_path, 'r', encoding='utf-8') as f:
-        plugin_data = json.load(f)
+    with open(plugin_json_path, 'rb') as f:
+        plugin_data = json.loads(f.read())
     
     guid = plugin_data.get('ID')
     name = plugin_data.get('Name')
@@ -48,21 +52,28 @@ def create_manifest(plugin_dir, version="1.0.0"):
         "Version": version,
         "Language": language,
         "Website": website,
-        "UrlDownload": f"https://github.com/{github_user}/{github_repo}/releases/download/v{version}/{github_repo}.zip",
+        "UrlDownload": "".join((
+            _GH_RELEASE, github_user, "/", github_repo,
+            "/releases/download/v", version, "/", github_repo, ".zip",
+        )),
         "UrlSourceCode": website,
-        "IcoPath": f"https://cdn.jsdelivr.net/gh/{github_user}/{github_repo}@main/{icon_path.replace(chr(92), '/')}"
+        "IcoPath": "".join((
+            _JSDELIVR, github_user, "/", github_repo, "@main/",
+            icon_path.replace('\\', '/'),
+        ))
     }
     
     # Create filename
     manifest_filename = f"{name}-{guid}.json"
     
     # Save manifest
+    manifest_json = json.dumps(manifest, indent=2)
     with open(manifest_filename, 'w', encoding='utf-8') as f:
-        json.dump(manifest, f, indent=2)
+        f.write(manifest_json)
     
     print(f"✅ Manifest created: {manifest_filename}")
     print(f"\n📋 Manifest content:")
-    print(json.dumps(manifest, indent=2))
+    print(manifest_json)
     print(f"\n📝 Next steps:")
     print(f"1. Fork https://github.com/Flow-Launcher/Flow.Launcher.PluginsManifest")
     print(f"2. Add {manifest_filename} to the plugins/ directory")
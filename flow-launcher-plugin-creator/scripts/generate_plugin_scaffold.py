@@ -7,6 +7,7 @@ import os
 import sys
 import uuid
 import json
+import string
 from pathlib import Path
 
 
@@ -31,53 +32,56 @@ def create_plugin_json(plugin_name, author, description, action_keyword, guid):
     }, indent=4)
 
 
-def create_requirements_txt():
-    """Create requirements.txt content."""
-    return """flowlauncher>=0.2.0
+REQUIREMENTS_TXT = """flowlauncher>=0.2.0
 pyperclip>=1.8.0
 """
+REQUIREMENTS_TXT_BYTES = REQUIREMENTS_TXT.encode('utf-8')
 
 
-def create_main_py(plugin_name):
-    """Create main.py content."""
-    return f'''"""
-{plugin_name} Plugin for Flow Launcher
+def create_requirements_txt():
+    """Create requirements.txt content."""
+    return REQUIREMENTS_TXT
+
+
+MAIN_PY_TEMPLATE = string.Template('''"""
+$plugin_name Plugin for Flow Launcher
 """
 
 import sys
 import os
 
 parent_folder_path = os.path.abspath(os.path.dirname(__file__))
-sys.path.append(parent_folder_path)
-sys.path.append(os.path.join(parent_folder_path, 'lib'))
-sys.path.append(os.path.join(parent_folder_path, '..', 'lib'))
+sys.path[:0] = (
+    parent_folder_path,
+    parent_folder_path + os.sep + 'lib',
+    parent_folder_path + os.sep + '..' + os.sep + 'lib',
+)
 
 from flowlauncher import FlowLauncher
 
+# Returned as-is for empty queries, which arrive on every keystroke
+_EMPTY_RESULT = [{
+    "Title": "Type something...",
+    "SubTitle": "Start typing to see results",
+    "IcoPath": "Images/icon.png"
+}]
+
 
-class {plugin_name}(FlowLauncher):
+class $plugin_name(FlowLauncher):
     def query(self, query):
         """Handle user query."""
-        results = []
+        if not query or query.isspace():
+            return _EMPTY_RESULT
         
-        if query.strip():
-            results.append({{
-                "Title": f"You searched for: {{query}}",
-                "SubTitle": "Press Enter to continue",
-                "IcoPath": "Images/icon.png",
-                "JsonRPCAction": {{
-                    "method": "handle_action",
-                    "parameters": [query]
-                }}
-            }})
-        else:
-            results.append({{
-                "Title": "Type something...",
-                "SubTitle": "Start typing to see results",
-                "IcoPath": "Images/icon.png"
-            }})
-        
-        return results
+        return [{
+            "Title": f"You searched for: {query}",
+            "SubTitle": "Press Enter to continue",
+            "IcoPath": "Images/icon.png",
+            "JsonRPCAction": {
+                "method": "handle_action",
+                "parameters": [query]
+            }
+        }]
     
     def handle_action(self, query):
         """Handle the action."""
@@ -86,15 +90,18 @@ class {plugin_name}(FlowLauncher):
 
 
 if __name__ == "__main__":
-    {plugin_name}()
-'''
+    $plugin_name()
+''')
 
 
-def create_readme(plugin_name, description):
-    """Create README.md content."""
-    return f"""# {plugin_name} Plugin for Flow Launcher
+def create_main_py(plugin_name):
+    """Create main.py content."""
+    return MAIN_PY_TEMPLATE.substitute(plugin_name=plugin_name)
 
-{description}
+
+README_TEMPLATE = string.Template("""# $plugin_name Plugin for Flow Launcher
+
+$description
 
 ## Features
 
@@ -128,13 +135,16 @@ See `.github/workflows/publish-release.yml` for automated builds.
 ## License
 
 MIT License
-"""
+""")
 
 
-def create_test_py(plugin_name):
-    """Create test.py content."""
-    return f'''"""
-Test suite for {plugin_name}
+def create_readme(plugin_name, description):
+    """Create README.md content."""
+    return README_TEMPLATE.substitute(plugin_name=plugin_name, description=description)
+
+
+TEST_PY_TEMPLATE = string.Template('''"""
+Test suite for $plugin_name
 """
 
 def test_query():
@@ -154,12 +164,15 @@ if __name__ == "__main__":
     test_query()
     test_action()
     print("All tests passed!")
-'''
+''')
 
 
-def create_github_workflow():
-    """Create GitHub Actions workflow."""
-    return """name: Publish Release
+def create_test_py(plugin_name):
+    """Create test.py content."""
+    return TEST_PY_TEMPLATE.substitute(plugin_name=plugin_name)
+
+
+GITHUB_WORKFLOW = """name: Publish Release
 
 on:
   workflow_dispatch:
@@ -197,31 +210,51 @@ jobs:
         env:
           GITHUB_TOKEN: ${{ secrets.GITHUB_TOKEN }}
 """
+GITHUB_WORKFLOW_BYTES = GITHUB_WORKFLOW.encode('utf-8')
+
+
+def create_github_workflow():
+    """Create GitHub Actions workflow."""
+    return GITHUB_WORKFLOW
+
+
+def write_file(filepath, data):
+    """Write bytes to a file with a single low-level open/write/close."""
+    # O_BINARY keeps Windows from translating newlines
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+    fd = os.open(filepath, flags, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
 
 
 def generate_scaffold(plugin_name, author, description, action_keyword):
     """Generate complete plugin scaffold."""
     guid = generate_guid()
     
-    # Create directory structure
     plugin_dir = f"Flow.Launcher.Plugin.{plugin_name}"
-    os.makedirs(plugin_dir, exist_ok=True)
-    os.makedirs(f"{plugin_dir}/Images", exist_ok=True)
-    os.makedirs(f"{plugin_dir}/.github/workflows", exist_ok=True)
     
-    # Create files
+    # Build every file up front as UTF-8 bytes (constant files are pre-encoded)
     files = {
-        f"{plugin_dir}/plugin.json": create_plugin_json(plugin_name, author, description, action_keyword, guid),
-        f"{plugin_dir}/requirements.txt": create_requirements_txt(),
-        f"{plugin_dir}/main.py": create_main_py(plugin_name),
-        f"{plugin_dir}/README.md": create_readme(plugin_name, description),
-        f"{plugin_dir}/test.py": create_test_py(plugin_name),
-        f"{plugin_dir}/.github/workflows/publish-release.yml": create_github_workflow(),
+        f"{plugin_dir}/plugin.json": create_plugin_json(plugin_name, author, description, action_keyword, guid).encode('utf-8'),
+        f"{plugin_dir}/requirements.txt": REQUIREMENTS_TXT_BYTES,
+        f"{plugin_dir}/main.py": create_main_py(plugin_name).encode('utf-8'),
+        f"{plugin_dir}/README.md": create_readme(plugin_name, description).encode('utf-8'),
+        f"{plugin_dir}/test.py": create_test_py(plugin_name).encode('utf-8'),
+        f"{plugin_dir}/.github/workflows/publish-release.yml": GITHUB_WORKFLOW_BYTES,
     }
     
+    # Create directory structure (makedirs also creates the parents)
+    directories = {os.path.dirname(filepath) for filepath in files}
+    directories.add(f"{plugin_dir}/Images")
+    for directory in directories:
+        os.makedirs(directory, exist_ok=True)
+    
     for filepath, content in files.items():
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
+        write_file(filepath, content)
     
     print(f"✅ Plugin scaffold created: {plugin_dir}")
     print(f"📋 GUID: {guid}")
@@ -5,17 +5,27 @@ Use this as a starting point for simple query-response plugins.
 
 import sys
 import os
+import logging
 
 # Add parent directory to path for flowlauncher module
 parent_folder_path = os.path.abspath(os.path.dirname(__file__))
-sys.path.append(parent_folder_path)
-sys.path.append(os.path.join(parent_folder_path, 'lib'))
-sys.path.append(os.path.join(parent_folder_path, '..',
-
- 'lib'))
+sys.path[:0] = (
+    parent_folder_path,
+    parent_folder_path + os.sep + 'lib',
+    parent_folder_path + os.sep + '..' + os.sep + 'lib',
+)
 
 from flowlauncher import FlowLauncher
 
+logger = logging.getLogger(__name__)
+
+# Returned as-is for empty queries, which arrive on every keystroke
+_EMPTY_RESULT = [{
+    "Title": "Type something...",
+    "SubTitle": "Enter your query to see results",
+    "IcoPath": "Images/icon.png"
+}]
+
 
 class BasicPlugin(FlowLauncher):
     def query(self, query):
@@ -28,27 +38,19 @@ class BasicPlugin(FlowLauncher):
         Returns:
             list: List of result dictionaries
         """
-        results = []
+        if not query or query.isspace():
+            return _EMPTY_RESULT
         
         # Example: Echo the query back
-        if query.strip():
-            results.append({
-                "Title": f"You typed: {query}",
-                "SubTitle": "Press Enter to copy to clipboard",
-                "IcoPath": "Images/icon.png",
-                "JsonRPCAction": {
-                    "method": "copy_to_clipboard",
-                    "parameters": [query]
-                }
-            })
-        else:
-            results.append({
-                "Title": "Type something...",
-                "SubTitle": "Enter your query to see results",
-                "IcoPath": "Images/icon.png"
-            })
-        
-        return results
+        return [{
+            "Title": f"You typed: {query}",
+            "SubTitle": "Press Enter to copy to clipboard",
+            "IcoPath": "Images/icon.png",
+            "JsonRPCAction": {
+                "method": "copy_to_clipboard",
+                "parameters": [query]
+            }
+        }]
     
     def copy_to_clipboard(self, text):
         """Copy text to clipboard."""
@@ -57,7 +59,7 @@ class BasicPlugin(FlowLauncher):
             pyperclip.copy(text)
             return True
         except Exception as e:
-            self.logger.error(f"Error copying to clipboard: {e}")
+            logger.error(f"Error copying to clipboard: {e}")
             return False
     
     def context_menu(self, data):
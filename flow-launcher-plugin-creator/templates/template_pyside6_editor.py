@@ -6,17 +6,38 @@ Use this for creating data editors for Flow Launcher plugins
 import sys
 import os
 import json
-from pathlib import Path
 
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QTableWidget, QTableWidgetItem, QPushButton, QDialog,
+    QTableView, QPushButton, QDialog,
     QFormLayout, QLineEdit, QComboBox, QSpinBox, QLabel,
     QFileDialog, QMessageBox, QMenuBar, QTextEdit
 )
-from PySide6.QtCore import Qt, QSettings
+from PySide6.QtCore import Qt, QSettings, QTimer, QByteArray, QAbstractTableModel, QModelIndex
 from PySide6.QtGui import QAction
 
+# orjson is optional; fall back to the stdlib json module without it
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj):
+        return json.dumps(obj, indent=2).encode('utf-8')
+
+# Identifies this editor's settings - rename both for your own editor so
+# separate editors built from this template don't share settings
+ORG_NAME = 'Author'
+APP_NAME = 'AppName'
+
+# Window geometry lives in a plain file; QSettings on Windows is the registry
+GEOMETRY_FILE = os.path.join(os.path.expanduser('~'), f'.{ORG_NAME}_{APP_NAME}_geometry.bin')
+
 
 class ItemDialog(QDialog):
     """Dialog for adding/editing items."""
@@ -133,6 +154,64 @@ class ItemDialog(QDialog):
         }
 
 
+class ItemTableModel(QAbstractTableModel):
+    """Table model that reads cells straight from the item list."""
+    
+    # (header, item key, default)
+    COLUMNS = [
+        ('Name', 'name', ''),
+        ('Type', 'type', ''),
+        ('Path', 'path', ''),
+        ('Category', 'category', ''),
+        ('Priority', 'priority', 100),
+    ]
+    
+    def __init__(self, items, parent=None):
+        super().__init__(parent)
+        self.items = items
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.items)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole:
+            _, key, default = self.COLUMNS[index.column()]
+            return str(self.items[index.row()].get(key, default))
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.COLUMNS[section][0]
+        return None
+    
+    def set_items(self, items):
+        """Replace the backing list with a single model reset."""
+        self.beginResetModel()
+        self.items = items
+        self.endResetModel()
+    
+    def append_item(self, item):
+        """Append one item, inserting only its row."""
+        row = len(self.items)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.items.append(item)
+        self.endInsertRows()
+    
+    def replace_item(self, row, item):
+        """Replace one item, repainting only its row."""
+        self.items[row] = item
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.COLUMNS) - 1))
+    
+    def remove_item(self, row):
+        """Remove one item, dropping only its row."""
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self.items[row]
+        self.endRemoveRows()
+
+
 class EditorWindow(QMainWindow):
     """Main editor window."""
     
@@ -140,12 +219,18 @@ class EditorWindow(QMainWindow):
         super().__init__()
         
         # Settings
-        self.settings = QSettings('Author', 'AppName')
+        self.settings = QSettings(ORG_NAME, APP_NAME)
         
         # Find data file
         self.data_file = self.find_data_file()
         self.items = []
         
+        # Coalesce rapid edits into one disk write
+        self.save_timer = QTimer(self)
+        self.save_timer.setSingleShot(True)
+        self.save_timer.setInterval(500)
+        self.save_timer.timeout.connect(self.save_data)
+        
         self.setWindowTitle("Data Editor")
         self.setMinimumSize(900, 600)
         
@@ -158,16 +243,19 @@ class EditorWindow(QMainWindow):
         """Find the data JSON file."""
         # Try multiple locations
         possible_paths = [
-            Path(__file__).parent / '..' / 'Plugin' / 'data.json',
-            Path.home() / 'AppData' / 'Roaming' / 'FlowLauncher' / 'Plugins' / 'YourPlugin' / 'data.json',
+            os.path.join(os.path.dirname(__file__), '..', 'Plugin', 'data.json'),
+            os.path.join(os.path.expanduser('~'), 'AppData', 'Roaming', 'FlowLauncher', 'Plugins', 'YourPlugin', 'data.json'),
         ]
         
         for path in possible_paths:
-            if path.exists():
-                return str(path)
+            try:
+                os.stat(path)
+                return path
+            except OSError:
+                continue
         
         # Default to first path
-        return str(possible_paths[0])
+        return possible_paths[0]
     
     def setup_menu(self):
         """Setup menu bar."""
@@ -198,12 +286,12 @@ class EditorWindow(QMainWindow):
         central_widget = QWidget()
         layout = QVBoxLayout()
         
-        # Table
-        self.table = QTableWidget()
-        self.table.setColumnCount(5)
-        self.table.setHorizontalHeaderLabels(['Name', 'Type', 'Path', 'Category', 'Priority'])
+        # Table (cells are read from self.items on demand by the model)
+        self.model = ItemTableModel(self.items, self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
         self.table.horizontalHeader().setStretchLastSection(False)
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
         layout.addWidget(self.table)
         
         # Buttons
@@ -235,10 +323,12 @@ class EditorWindow(QMainWindow):
     def load_data(self):
         """Load data from JSON file."""
         try:
-            if os.path.exists(self.data_file):
-                with open(self.data_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self.items = data.get('items', [])
+            # Read the whole file at once and parse the bytes directly
+            with open(self.data_file, 'rb') as f:
+                data = _loads(f.read())
+            self.items = data.get('items', [])
+        except FileNotFoundError:
+            self.items = []
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Failed to load data: {e}")
             self.items = []
@@ -247,27 +337,31 @@ class EditorWindow(QMainWindow):
     
     def save_data(self):
         """Save data to JSON file."""
+        self.save_timer.stop()
         try:
-            # Ensure directory exists
-            os.makedirs(os.path.dirname(self.data_file), exist_ok=True)
+            # Serialize up front so the file gets a single write
+            blob = _dumps({'items': self.items})
             
-            with open(self.data_file, 'w', encoding='utf-8') as f:
-                json.dump({'items': self.items}, f, indent=2)
+            try:
+                f = open(self.data_file, 'wb')
+            except FileNotFoundError:
+                # Create the directory only when it is actually missing
+                os.makedirs(os.path.dirname(self.data_file), exist_ok=True)
+                f = open(self.data_file, 'wb')
+            with f:
+                f.write(blob)
             
             self.status_label.setText(f"Saved {len(self.items)} items")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to save data: {e}")
     
+    def schedule_save(self):
+        """Save shortly after the last change instead of on every change."""
+        self.save_timer.start()
+    
     def refresh_table(self):
         """Refresh table with current data."""
-        self.table.setRowCount(len(self.items))
-        
-        for i, item in enumerate(self.items):
-            self.table.setItem(i, 0, QTableWidgetItem(item.get('name', '')))
-            self.table.setItem(i, 1, QTableWidgetItem(item.get('type', '')))
-            self.table.setItem(i, 2, QTableWidgetItem(item.get('path', '')))
-            self.table.setItem(i, 3, QTableWidgetItem(item.get('category', '')))
-            self.table.setItem(i, 4, QTableWidgetItem(str(item.get('priority', 100))))
+        self.model.set_items(self.items)
         
         self.status_label.setText(f"Loaded {len(self.items)} items")
     
@@ -275,26 +369,24 @@ class EditorWindow(QMainWindow):
         """Add new item."""
         dialog = ItemDialog(self)
         if dialog.exec():
-            self.items.append(dialog.get_data())
-            self.save_data()
-            self.refresh_table()
+            self.model.append_item(dialog.get_data())
+            self.schedule_save()
     
     def edit_item(self):
         """Edit selected item."""
-        row = self.table.currentRow()
+        row = self.table.currentIndex().row()
         if row < 0:
             QMessageBox.warning(self, "Warning", "Please select an item to edit")
             return
         
         dialog = ItemDialog(self, self.items[row])
         if dialog.exec():
-            self.items[row] = dialog.get_data()
-            self.save_data()
-            self.refresh_table()
+            self.model.replace_item(row, dialog.get_data())
+            self.schedule_save()
     
     def delete_item(self):
         """Delete selected item."""
-        row = self.table.currentRow()
+        row = self.table.currentIndex().row()
         if row < 0:
             QMessageBox.warning(self, "Warning", "Please select an item to delete")
             return
@@ -307,9 +399,8 @@ class EditorWindow(QMainWindow):
         )
         
         if reply == QMessageBox.StandardButton.Yes:
-            del self.items[row]
-            self.save_data()
-            self.refresh_table()
+            self.model.remove_item(row)
+            self.schedule_save()
     
     def change_save_location(self):
         """Change data file save location."""
@@ -374,14 +465,22 @@ class EditorWindow(QMainWindow):
         about_dialog.exec()
     
     def restore_geometry(self):
-        """Restore window geometry from settings."""
-        geometry = self.settings.value('geometry')
-        if geometry:
-            self.restoreGeometry(geometry)
+        """Restore window geometry saved by closeEvent."""
+        try:
+            with open(GEOMETRY_FILE, 'rb') as f:
+                self.restoreGeometry(QByteArray(f.read()))
+        except OSError:
+            pass
     
     def closeEvent(self, event):
-        """Save geometry on close."""
-        self.settings.setValue('geometry', self.saveGeometry())
+        """Save geometry and any pending changes on close."""
+        if self.save_timer.isActive():
+            self.save_data()
+        try:
+            with open(GEOMETRY_FILE, 'wb') as f:
+                f.write(self.saveGeometry().data())
+        except OSError:
+            pass
         event.accept()
 
 
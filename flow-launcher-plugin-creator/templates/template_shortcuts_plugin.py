@@ -6,73 +6,207 @@ Perfect for plugins that manage user-defined items (shortcuts, bookmarks, notes,
 import sys
 import os
 import json
+import logging
+import pickle
 import subprocess
+from operator import itemgetter
 
 parent_folder_path = os.path.abspath(os.path.dirname(__file__))
-sys.path.append(parent_folder_path)
-sys.path.append(os.path.join(parent_folder_path, 'lib'))
-sys.path.append(os.path.join(parent_folder_path, '..', 'lib'))
+_LIB = os.path.join(parent_folder_path, 'lib')
+_PARENT_LIB = os.path.join(parent_folder_path, '..', 'lib')
+# Put the plugin folder, lib and ../lib first (in that order), moving any
+# existing entry instead of adding a duplicate
+for _path in (_PARENT_LIB, _LIB, parent_folder_path):
+    if _path in sys.path:
+        sys.path.remove(_path)
+    sys.path.insert(0, _path)
+
+_SHORTCUTS_FILE = os.path.join(parent_folder_path, 'shortcuts.json')
+_EDITOR_PATH = os.path.join(parent_folder_path, '..', 'Editor', 'editor.py')
 
 from flowlauncher import FlowLauncher
 
+logger = logging.getLogger(__name__)
+
+# orjson is optional; fall back to the stdlib json module without it
+try:
+    import orjson
+
+    _loads = orjson.loads
+    # orjson parses at least as fast as the pickle cache would load
+    _USE_PARSE_CACHE = False
+
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _loads = json.loads
+    _USE_PARSE_CACHE = True
+
+    def _dumps(obj):
+        return json.dumps(obj, indent=2).encode('utf-8')
+
+_PRIORITY_KEY = itemgetter('priority')
+
+_ICON = "Images/icon.png"
+_FOLDER_ICON = "Images/folder.png"
+
+# Returned as-is for empty queries, which arrive on every keystroke
+_HELP_RESULT = [{
+    "Title": "Type a shortcut keyword",
+    "SubTitle": "Or type 'list' to see all shortcuts",
+    "IcoPath": _ICON
+}]
+
+# Context menu entry that never changes, shared by every right-click
+_EDIT_SHORTCUT_ITEM = {
+    "Title": "Edit Shortcut",
+    "SubTitle": "Open editor to modify this shortcut",
+    "JsonRPCAction": {
+        "method": "open_editor",
+        "parameters": []
+    }
+}
+
 
 class ShortcutsPlugin(FlowLauncher):
     def __init__(self):
         # Initialize data before calling super().__init__()
-        self.shortcuts_file = os.path.join(parent_folder_path, 'shortcuts.json')
-        self.shortcuts = self.load_shortcuts()
+        self.shortcuts_file = _SHORTCUTS_FILE
+        self.cache_file = _SHORTCUTS_FILE + '.cache'
+        self._last_blob = None  # File contents as last read or written
+        self._categories = None
+        self._list_cache = None
         
         super().__init__()
     
+    def __getattr__(self, name):
+        """Load shortcuts the first time they are needed."""
+        # Not a property: FlowLauncher dispatches through inspect.getmembers(),
+        # which would evaluate a property (and load the file) on every call
+        if name in ('shortcuts', '_by_keyword', '_by_exact_keyword'):
+            self.shortcuts = self.load_shortcuts()
+            self.index_shortcuts()
+            return getattr(self, name)
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+    
     def load_shortcuts(self):
-        """Load shortcuts from JSON file."""
+        """Load shortcuts from JSON file (or its parsed cache if unchanged)."""
         try:
-            if os.path.exists(self.shortcuts_file):
-                with open(self.shortcuts_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    return data.get('shortcuts', [])
+            st = os.stat(self.shortcuts_file)
+        except OSError:
             return []
+        
+        # Every request is a new process; without orjson, skip the JSON
+        # parse when the file hasn't changed since the last one
+        cache_key = (st.st_mtime_ns, st.st_size)
+        if _USE_PARSE_CACHE:
+            shortcuts = self.read_cache(cache_key)
+            if shortcuts is not None:
+                return shortcuts
+        
+        try:
+            with open(self.shortcuts_file, 'rb') as f:
+                blob = f.read()
+            data = _loads(blob)
+            self._last_blob = blob
+            shortcuts = data.get('shortcuts', [])
+            
+            # Fill in defaults once so sorting can use plain key lookups
+            for shortcut in shortcuts:
+                shortcut.setdefault('priority', 0)
+                shortcut.setdefault('category', 'Uncategorized')
         except Exception as e:
-            self.logger.error(f"Error loading shortcuts: {e}")
+            logger.error(f"Error loading shortcuts: {e}")
             return []
+        
+        if _USE_PARSE_CACHE:
+            self.write_cache(cache_key, shortcuts)
+        return shortcuts
+    
+    def read_cache(self, cache_key):
+        """Return the cached shortcuts if they match cache_key, else None."""
+        try:
+            with open(self.cache_file, 'rb') as f:
+                key, shortcuts = pickle.load(f)
+        except Exception:
+            # Missing, stale-format or corrupt cache: fall back to the JSON
+            return None
+        return shortcuts if key == cache_key else None
+    
+    def write_cache(self, cache_key, shortcuts):
+        """Store the parsed shortcuts for the next invocation."""
+        try:
+            with open(self.cache_file, 'wb') as f:
+                pickle.dump((cache_key, shortcuts), f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError:
+            pass  # The cache is only an optimization
+    
+    def index_shortcuts(self):
+        """Index shortcuts by keyword for O(1) lookups."""
+        # Lowercase keyword -> every matching shortcut, for queries
+        self._by_keyword = {}
+        # Exact keyword -> first matching shortcut, for actions
+        self._by_exact_keyword = {}
+        for shortcut in self.shortcuts:
+            keyword = shortcut.get('keyword', '')
+            self._by_keyword.setdefault(keyword.lower(), []).append(shortcut)
+            self._by_exact_keyword.setdefault(keyword, shortcut)
+    
+    def find_shortcut(self, keyword):
+        """Find a shortcut by its exact keyword."""
+        return self._by_exact_keyword.get(keyword)
     
     def save_shortcuts(self):
-        """Save shortcuts to JSON file."""
+        """Save shortcuts to JSON file (atomically, skipping no-op saves)."""
+        # The cached groups and list view are stale once the data changes
+        self._categories = None
+        self._list_cache = None
         try:
-            with open(self.shortcuts_file, 'w', encoding='utf-8') as f:
-                json.dump({'shortcuts': self.shortcuts}, f, indent=2)
+            blob = _dumps({'shortcuts': self.shortcuts})
+            if self._last_blob is None:
+                # Loaded from the parse cache, which doesn't keep the bytes
+                try:
+                    with open(self.shortcuts_file, 'rb') as f:
+                        self._last_blob = f.read()
+                except OSError:
+                    pass
+            if blob == self._last_blob:
+                return
+            
+            # Write a sibling temp file, then swap it in so readers never
+            # see a half-written file
+            temp_path = self.shortcuts_file + '.tmp'
+            with open(temp_path, 'wb') as f:
+                f.write(blob)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.shortcuts_file)
+            self._last_blob = blob
         except Exception as e:
-            self.logger.error(f"Error saving shortcuts: {e}")
+            logger.error(f"Error saving shortcuts: {e}")
     
     def query(self, query):
         """Handle user query."""
-        results = []
+        # Show help
+        if not query or query.isspace():
+            return _HELP_RESULT
+        
+        q_lower = query.lower()
         
         # Special command: list all shortcuts
-        if query.lower() == 'list':
+        if q_lower == 'list':
             return self.show_shortcut_list()
         
-        # Search shortcuts by keyword
-        if query.strip():
-            for shortcut in self.shortcuts:
-                if query.lower() == shortcut.get('keyword', '').lower():
-                    results.append(self.format_shortcut_result(shortcut))
-        else:
-            # Show help
-            results.append({
-                "Title": "Type a shortcut keyword",
-                "SubTitle": "Or type 'list' to see all shortcuts",
-                "IcoPath": "Images/icon.png"
-            })
-        
-        return results
+        # Search shortcuts by keyword (case-insensitive)
+        return [self.format_shortcut_result(shortcut)
+                for shortcut in self._by_keyword.get(q_lower, ())]
     
     def format_shortcut_result(self, shortcut):
         """Format a shortcut as a Flow Launcher result."""
         return {
             "Title": shortcut.get('name', 'Unnamed'),
             "SubTitle": shortcut.get('path', ''),
-            "IcoPath": shortcut.get('icon', 'Images/icon.png'),
+            "IcoPath": shortcut.get('icon', _ICON),
             "JsonRPCAction": {
                 "method": "execute_shortcut",
                 "parameters": [shortcut['keyword']]
@@ -80,36 +214,45 @@ class ShortcutsPlugin(FlowLauncher):
             "ContextData": shortcut['keyword']
         }
     
+    def group_by_category(self):
+        """Group shortcuts by category, sorted by name and then priority."""
+        # Built once per data change and reused, so reads don't re-sort
+        if self._categories is None:
+            categories = {}
+            for shortcut in self.shortcuts:
+                categories.setdefault(shortcut['category'], []).append(shortcut)
+            
+            for shortcuts in categories.values():
+                shortcuts.sort(key=_PRIORITY_KEY, reverse=True)
+            
+            self._categories = dict(sorted(categories.items(), key=itemgetter(0)))
+        return self._categories
+    
     def show_shortcut_list(self):
         """Show all shortcuts grouped by category."""
-        results = []
+        if self._list_cache is not None:
+            return self._list_cache
         
-        # Group by category
-        categories = {}
-        for shortcut in self.shortcuts:
-            category = shortcut.get('category', 'Uncategorized')
-            if category not in categories:
-                categories[category] = []
-            categories[category].append(shortcut)
+        results = []
         
-        # Sort categories by priority
-        for category, shortcuts in sorted(categories.items()):
+        for category, shortcuts in self.group_by_category().items():
             # Category header
             results.append({
                 "Title": f"📁 {category}",
                 "SubTitle": f"{len(shortcuts)} shortcuts",
-                "IcoPath": "Images/folder.png"
+                "IcoPath": _FOLDER_ICON
             })
             
-            # Shortcuts in category
-            for shortcut in sorted(shortcuts, key=lambda x: x.get('priority', 0), reverse=True):
+            # Shortcuts in category (already in priority order)
+            for shortcut in shortcuts:
                 results.append(self.format_shortcut_result(shortcut))
         
+        self._list_cache = results
         return results
     
     def execute_shortcut(self, keyword):
         """Execute a shortcut by keyword."""
-        shortcut = next((s for s in self.shortcuts if s['keyword'] == keyword), None)
+        shortcut = self.find_shortcut(keyword)
         
         if not shortcut:
             return False
@@ -128,7 +271,7 @@ class ShortcutsPlugin(FlowLauncher):
                 os.startfile(path)
             elif shortcut_type == 'folder':
                 # Open folder in Explorer
-                subprocess.Popen(f'explorer "{path}"')
+                subprocess.Popen(['explorer', path])
             elif shortcut_type == 'file':
                 # Open file with default or specific application
                 open_with = shortcut.get('openWith')
@@ -142,20 +285,13 @@ class ShortcutsPlugin(FlowLauncher):
             
             return True
         except Exception as e:
-            self.logger.error(f"Error executing shortcut: {e}")
+            logger.error(f"Error executing shortcut: {e}")
             return False
     
     def context_menu(self, data):
         """Provide context menu for shortcuts."""
         return [
-            {
-                "Title": "Edit Shortcut",
-                "SubTitle": "Open editor to modify this shortcut",
-                "JsonRPCAction": {
-                    "method": "open_editor",
-                    "parameters": []
-                }
-            },
+            _EDIT_SHORTCUT_ITEM,
             {
                 "Title": "Copy Path",
                 "SubTitle": "Copy path/URL to clipboard",
@@ -177,24 +313,32 @@ class ShortcutsPlugin(FlowLauncher):
     def open_editor(self):
         """Open the GUI editor."""
         try:
-            editor_path = os.path.join(parent_folder_path, '..', 'Editor', 'editor.py')
-            if os.path.exists(editor_path):
-                subprocess.Popen([sys.executable, editor_path])
+            if os.path.exists(_EDITOR_PATH):
+                subprocess.Popen([sys.executable, _EDITOR_PATH])
             else:
                 os.startfile(self.shortcuts_file)
         except Exception as e:
-            self.logger.error(f"Error opening editor: {e}")
+            logger.error(f"Error opening editor: {e}")
     
     def copy_path(self, keyword):
         """Copy shortcut path to clipboard."""
-        shortcut = next((s for s in self.shortcuts if s['keyword'] == keyword), None)
-        if shortcut:
+        shortcut = self.find_shortcut(keyword)
+        if not shortcut:
+            return False
+        
+        try:
+            # Imported here so queries don't pay for it at startup
             import pyperclip
             pyperclip.copy(shortcut.get('path', ''))
+            return True
+        except Exception as e:
+            logger.error(f"Error copying path: {e}")
+            return False
     
     def delete_shortcut(self, keyword):
         """Delete a shortcut."""
         self.shortcuts = [s for s in self.shortcuts if s['keyword'] != keyword]
+        self.index_shortcuts()
         self.save_shortcuts()
 
 